@@ -0,0 +1,199 @@
+# cython: language_level=3
+"""Compiled class_value and class_property descriptors.
+
+The descriptor methods are C slot functions, so reading or setting `MyClass.value` and `instance.value` skips most of
+the interpreter overhead. This extension is optional. `descriptors` keeps the pure Python classes when it is not built.
+"""
+from .descriptors import metaclass, decorate, register_class_value_type, _arg_count
+
+
+__all__ = ['class_value', 'class_property']
+
+
+# Marks the value and doc fields as unset, so they raise AttributeError or fall back like the unset pure Python slots
+cdef object _UNSET = object()
+
+
+def _init_subclass(cls, **kwargs):
+    """Register Python subclasses of class_value, so the metaclass recognizes them, and keep the instance docstring
+    working when the subclass has a class docstring."""
+    super(class_value, cls).__init_subclass__(**kwargs)
+    cls.__doc__ = _subclass_doc(cls.__dict__.get('__doc__', None))
+    register_class_value_type(cls)
+
+
+cdef class class_value:
+    """Class value that shares the same value with the class and any instance."""
+    cdef object _value
+    cdef object _doc
+    cdef object __weakref__
+
+    metaclass = staticmethod(metaclass)
+    decorate = staticmethod(decorate)
+
+    # Extension types cannot define __init_subclass__ as a method, so set the classmethod as an attribute
+    __init_subclass__ = classmethod(_init_subclass)
+
+    def __cinit__(self, *args, **kwargs):
+        self._value = _UNSET
+        self._doc = _UNSET
+
+    def __init__(self, value=None, doc=''):
+        self._value = value
+        self._doc = doc
+
+    @property
+    def value(self):
+        if self._value is _UNSET:
+            raise AttributeError("'{}' object has no attribute 'value'".format(type(self).__name__))
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+
+    @value.deleter
+    def value(self):
+        if self._value is _UNSET:
+            raise AttributeError('value')
+        self._value = _UNSET
+
+    @property
+    def __doc__(self):
+        if self._doc is _UNSET:
+            return type(self).__doc__
+        return self._doc
+
+    @__doc__.setter
+    def __doc__(self, value):
+        self._doc = value
+
+    def __get__(self, instance, owner):
+        if self._value is _UNSET:
+            raise AttributeError("'{}' object has no attribute 'value'".format(type(self).__name__))
+        return self._value
+
+    def __set__(self, obj, value):
+        self._value = value
+
+    def __delete__(self, instance):
+        raise AttributeError('__delete__')
+
+
+cdef class _subclass_doc:
+    """`__doc__` for Python subclasses of class_value. Gives the class docstring on the class and the instance docstring
+    on instances."""
+    cdef object class_doc
+
+    def __init__(self, class_doc=None):
+        self.class_doc = class_doc
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self.class_doc
+
+        doc = (<class_value> instance)._doc
+        if doc is _UNSET:
+            return self.class_doc  # Subclasses may not call class_value.__init__
+        return doc
+
+    def __set__(self, instance, value):
+        (<class_value> instance)._doc = value
+
+
+cdef class class_property(class_value):
+    """Property that works with the class and any instance."""
+    cdef public object fget
+    cdef public object fset
+    cdef public object fdel
+    cdef public int _fget_args
+    cdef public int _fset_args
+    cdef public int _fdel_args
+    cdef public bint _fget_takes_instance
+    cdef public bint _fset_takes_value_only
+    cdef public bint _fdel_takes_instance
+
+    def __init__(self, fget=None, fset=None, fdel=None, doc=''):
+        # The value is left unset, a class_property does not hold a value
+        self._doc = doc
+        self._fset_takes_value_only = True
+
+        # Call setting functions
+        if fget is not None:
+            self.getter(fget)
+        if fset is not None:
+            self.setter(fset)
+        if fdel is not None:
+            self.deleter(fdel)
+
+    def __get__(self, instance, owner):
+        if self.fget is None:
+            raise AttributeError("unreadable attribute")
+
+        if self._fget_takes_instance:
+            return self.fget(instance or owner)
+        return self.fget()
+
+    def __set__(self, obj, value):
+        if self.fset is None:
+            raise AttributeError("can't set attribute")
+
+        if self._fset_takes_value_only:
+            self.fset(value)
+        else:
+            self.fset(obj, value)
+
+    def __delete__(self, instance):
+        if self.fdel is None:
+            raise AttributeError("can't delete attribute")
+
+        if self._fdel_takes_instance:
+            self.fdel(instance)
+        else:
+            self.fdel()
+
+    # The class docstring is stored in this type's dict, which would hide the inherited __doc__ property
+    @property
+    def __doc__(self):
+        if self._doc is _UNSET:
+            return type(self).__doc__
+        return self._doc
+
+    @__doc__.setter
+    def __doc__(self, value):
+        self._doc = value
+
+    def getter(self, fget):
+        self.fget = fget
+
+        if callable(fget):
+            if not self._doc or self._doc is _UNSET:
+                self._doc = fget.__doc__
+            self._fget_args = _arg_count(fget)
+        else:
+            self._fget_args = 0
+        self._fget_takes_instance = self._fget_args > 0
+
+        return self
+
+    def setter(self, fset):
+        self.fset = fset
+
+        if callable(fset):
+            self._fset_args = _arg_count(fset)
+        else:
+            self._fset_args = 0
+        self._fset_takes_value_only = self._fset_args <= 1
+
+        return self
+
+    def deleter(self, fdel):
+        self.fdel = fdel
+
+        if callable(fdel):
+            self._fdel_args = _arg_count(fdel)
+        else:
+            self._fdel_args = 0
+        self._fdel_takes_instance = self._fdel_args > 0
+
+        return self
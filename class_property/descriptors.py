@@ -1,9 +1,106 @@
-import inspect
+import types
+import weakref
 import contextlib
-from functools import WRAPPER_ASSIGNMENTS
+from functools import partial
 
 
-__all__ = ['metaclass', 'decorate', 'class_value', 'class_property']
+__all__ = ['metaclass', 'decorate', 'class_value', 'class_property', 'register_class_value_type']
+
+
+# Exact class_value types, checked with `type(v) in _CV_TYPE_SET` instead of isinstance when creating classes
+_CV_TYPE_SET = frozenset()
+
+
+def register_class_value_type(cv_type):
+    """Register a class_value type, so the metaclass recognizes its instances.
+
+    Subclasses of class_value are registered automatically when they are created.
+    """
+    global _CV_TYPE_SET
+    _CV_TYPE_SET = _CV_TYPE_SET | {cv_type}
+    return cv_type
+
+
+# Code object flags (same as inspect.CO_VARARGS and inspect.CO_VARKEYWORDS). inspect is only imported when needed.
+_CO_VARARGS = 0x04
+_CO_VARKEYWORDS = 0x08
+_inspect = None
+
+# Number of parameters for callables that were already given to a class_property
+_ARG_COUNT_CACHE = weakref.WeakKeyDictionary()
+
+
+def _arg_count(fn):
+    """Return the number of parameters the given callable accepts (same as `len(inspect.signature(fn).parameters)`).
+
+    Results are cached with a weak reference to the callable. Callables that cannot be weakly referenced or hashed are
+    counted every time.
+    """
+    try:
+        return _ARG_COUNT_CACHE[fn]
+    except (KeyError, TypeError):
+        pass
+
+    count = _find_arg_count(fn)
+    try:
+        _ARG_COUNT_CACHE[fn] = count
+    except TypeError:
+        pass
+    return count
+
+
+def _code_arg_count(code, bound=False):
+    """Count the parameters from a code object the same way a Signature would."""
+    count = code.co_argcount + code.co_kwonlyargcount
+    count += bool(code.co_flags & _CO_VARARGS) + bool(code.co_flags & _CO_VARKEYWORDS)
+    if bound and code.co_argcount > 0:
+        count -= 1  # Bound method, the first argument is already given
+    return count
+
+
+def _has_signature_override(fn):
+    """Return if inspect.signature would not use the callable's own code (`__wrapped__` or `__signature__` is set)."""
+    return getattr(fn, '__wrapped__', None) is not None or getattr(fn, '__signature__', None) is not None
+
+
+def _find_arg_count(fn):
+    """Count the parameters of the given callable.
+
+    Functions, methods, staticmethods, partials and callable instances with a Python `__call__` are counted from their
+    code object, which avoids building a Signature object. Other callables (builtins, classes) and callables that set
+    `__wrapped__` or `__signature__` (like `functools.wraps` decorators) fall back to `inspect.signature`.
+    """
+    if isinstance(fn, staticmethod):
+        return _arg_count(fn.__func__)
+
+    if not _has_signature_override(fn):
+        if isinstance(fn, partial):
+            count = _arg_count(fn.func)
+            if not fn.args:
+                return count  # Keyword arguments stay in the signature as keyword only parameters
+
+            code = getattr(fn.func, '__code__', None)
+            if code is not None and not code.co_flags & _CO_VARARGS and not _has_signature_override(fn.func):
+                return max(count - len(fn.args), 0)
+
+        elif not isinstance(fn, type):
+            code = getattr(fn, '__code__', None)
+            if code is not None:
+                return _code_arg_count(code, bound=getattr(fn, '__self__', None) is not None)
+
+            # Look at the class attribute itself, a staticmethod __call__ does not get the instance
+            call = next((klass.__dict__['__call__'] for klass in type(fn).__mro__ if '__call__' in klass.__dict__), None)
+            if isinstance(call, types.FunctionType) and not _has_signature_override(call):
+                return _code_arg_count(call.__code__, bound=True)
+
+    global _inspect
+    if _inspect is None:
+        import inspect as _inspect
+
+    try:
+        return len(_inspect.signature(fn).parameters)
+    except (TypeError, ValueError):
+        return 0
 
 
 def metaclass(inherit=object):
@@ -12,6 +109,9 @@ def metaclass(inherit=object):
     Normally `class.variable = value` would simply change the class value. By using a metaclass you can force
     `class.variable = value` to call the variable's `__set__` method.
 
+    Every call creates a new metaclass. Class values are stored on the metaclass, so classes that share a metaclass
+    share their class values. Do not cache the result to reuse it for unrelated classes.
+
     Args:
         inherit (object)[object]: Class object used in inheritance to avoid metaclass conflicts.
 
@@ -31,7 +131,8 @@ def metaclass(inherit=object):
             cls = super().__new__(mcs, name, bases, attrs)
 
             # Register or set the value for the new class_value
-            mcs.register(cls, class_values)
+            if class_values:
+                mcs.register(cls, class_values)
 
             return cls
 
@@ -41,17 +142,16 @@ def metaclass(inherit=object):
             if bases is None:
                 bases = tuple()
 
+            # Names of the class values registered on the metaclass of any base
+            inherited = {name for base in bases for name, value in type(base).__dict__.items()
+                         if type(value) in _CV_TYPE_SET}
+
             # Find all new class values
             class_values = {}
             for k, v in list(attrs.items()):
-                # isinstance(getattr(meta, k, None), class_value):
-                try:
-                    if isinstance(v, class_value) or \
-                            any((isinstance(base.__class__.__dict__.get(k, None), class_value) for base in bases)):
-                        class_values[k] = v
-                        attrs.pop(k, None)
-                except (KeyError, AttributeError, Exception):
-                    pass
+                if type(v) in _CV_TYPE_SET or k in inherited:
+                    class_values[k] = v
+                    attrs.pop(k, None)
 
             return class_values, attrs
 
@@ -78,9 +178,9 @@ def metaclass(inherit=object):
             for k, v in class_values.items():
                 # Check if class has this class value
                 this_cv = mcs.__dict__.get(k, None)
-                if not isinstance(this_cv, class_value):
+                if type(this_cv) not in _CV_TYPE_SET:
                     # Set a new class value
-                    if not isinstance(v, class_value):
+                    if type(v) not in _CV_TYPE_SET:
                         v = class_value(v)
 
                     # Must set the class attribute, so instance objects have access
@@ -89,7 +189,7 @@ def metaclass(inherit=object):
 
                 else:
                     # Just change the current value
-                    if isinstance(v, class_value):
+                    if type(v) in _CV_TYPE_SET:
                         if type(v) != class_values:
                             # Change the class_value type (to class_property or something else)
                             for base in cls.__bases__[::-1]:
@@ -107,40 +207,54 @@ def metaclass(inherit=object):
                         # Get the new value
                         try:
                             v = v.__get__(cls, cls)
-                        except (NameError, AttributeError, Exception):
+                        except (NameError, AttributeError):
                             continue  # Cannot get value due to name error. The class must be defined first.
 
                     # Set the class_value with the new value
                     try:
                         this_cv.__set__(cls, v)
-                    except (NameError, AttributeError, Exception):
+                    except (NameError, AttributeError):
                         pass  # Cannot set value due to name error. The class must be defined first.
 
     ClassPropertyMetaclass.__name__ = '{}Metaclass'.format(inherit.__name__)
     return ClassPropertyMetaclass
 
 
-@contextlib.contextmanager
-def disable_property(obj, name):
+class disable_property(object):
     """Temporarily disable properties/attributes in the class bases with the given name
-    so they can be set on the new class."""
-    props = {}
+    so they can be set on the new class.
 
-    # Delete properties with the name so descriptors with __get__ and __set__ are not called when changing descriptors
-    try:
-        for base in obj.__bases__:
+    This is a plain context manager class instead of a generator to keep the `with` statement cheap.
+    """
+    __slots__ = ('obj', 'name', 'props')
+
+    def __init__(self, obj, name):
+        self.obj = obj
+        self.name = name
+        self.props = {}
+
+    def __enter__(self):
+        name = self.name
+        props = self.props
+
+        # Delete properties with the name so descriptors with __get__ and __set__ are not called when changing
+        # descriptors
+        for base in getattr(self.obj, '__bases__', ()):
             if name in base.__dict__:
-                props[base] = base.__dict__[name]
-                delattr(base, name)
-    except (AttributeError, Exception):
-        pass
+                try:
+                    value = base.__dict__[name]
+                    delattr(base, name)
+                except (AttributeError, TypeError):
+                    continue  # Builtin types cannot be changed
+                props[base] = value
 
-    # Run the with context block
-    yield props
+        return props
 
-    # Reset the properties
-    for base, v in props.items():
-        setattr(base, name, v)
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Reset the properties
+        for base, v in self.props.items():
+            setattr(base, self.name, v)
+        self.props = {}
 
 
 def set_class_property(cls, name, value, metaclass=None):
@@ -162,9 +276,18 @@ def set_class_property(cls, name, value, metaclass=None):
         value (class_value): Class value/property to set to the class and metaclass
         metaclass (type/object): Class metaclass to set class_value/class_property to so class object has access.
     """
-    with contextlib.suppress(AttributeError, Exception):
+    # Fast path, nothing with this name exists yet so there are no descriptors to remove first
+    bases = getattr(metaclass, '__bases__', ()) + getattr(cls, '__bases__', ())
+    if name not in getattr(metaclass, '__dict__', {}) and name not in getattr(cls, '__dict__', {}) and \
+            not any(name in base.__dict__ for base in bases):
+        setattr(cls, name, value)
+        if metaclass is not None:
+            setattr(metaclass, name, value)
+        return
+
+    with contextlib.suppress(AttributeError, TypeError):
         delattr(metaclass, name)  # Delete the metaclass attribute, so the metaclass attribute can be set
-    with contextlib.suppress(AttributeError, Exception):
+    with contextlib.suppress(AttributeError, TypeError):
         delattr(cls, name)  # Delete the class attribute, so the class attribute can be set (instead of calling __set__)
 
     with disable_property(metaclass, name):
@@ -199,28 +322,58 @@ def decorate(new_cls=None):
     # Need to use a metaclass
     meta = metaclass(new_cls)
 
-    # Create a new class using the metaclass
-    NewClass = meta(new_cls.__name__, new_cls.__bases__, new_cls.__dict__.copy())
+    # Skip attributes that type creates for the class (the old ones only work with new_cls instances)
+    skip = {'__dict__', '__weakref__'}
+    slots = new_cls.__dict__.get('__slots__', ())
+    for slot in ((slots,) if isinstance(slots, str) else slots):
+        if slot.startswith('__') and not slot.endswith('__'):
+            slot = '_{}{}'.format(new_cls.__name__.lstrip('_'), slot)  # Private names are stored mangled
+        skip.add(slot)
+
+    def exec_body(ns):
+        # The namespace carries __module__, __doc__ and __annotations__, types.new_class sets the __name__
+        ns.update((k, v) for k, v in new_cls.__dict__.items() if k not in skip)
+        ns['__qualname__'] = new_cls.__qualname__
 
-    # Make the NewClass look like the given new_cls
-    for attr in WRAPPER_ASSIGNMENTS:
-        try:
-            setattr(NewClass, attr, getattr(new_cls, attr))
-        except (AttributeError, Exception):
-            pass
+    # Create a new class using the metaclass
+    NewClass = types.new_class(new_cls.__name__, new_cls.__bases__, {'metaclass': meta}, exec_body)
 
     # Return new class using a metaclass
     return NewClass
 
 
+class _slot_doc(object):
+    """`__doc__` for classes using `__slots__`. Gives the class docstring on the class and the instance docstring
+    (stored in the `_doc` slot) on instances."""
+    __slots__ = ('class_doc',)
+
+    def __init__(self, class_doc=None):
+        self.class_doc = class_doc
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.class_doc
+        return getattr(instance, '_doc', self.class_doc)  # Subclasses may not call class_value.__init__
+
+    def __set__(self, instance, value):
+        instance._doc = value
+
+
 class class_value(object):
     """Class value that shares the same value with the class and any instance."""
+    __slots__ = ('value', '_doc', '__weakref__')
+
     metaclass = staticmethod(metaclass)
     decorate = staticmethod(decorate)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__doc__ = _slot_doc(cls.__dict__.get('__doc__', None))
+        register_class_value_type(cls)
+
     def __init__(self, value=None, doc=''):
         self.value = value
-        self.__doc__ = doc
+        self._doc = doc  # Set the slot directly, the __doc__ descriptor is for outside access
 
     def __get__(self, instance, owner=None):
         return self.value
@@ -229,24 +382,28 @@ class class_value(object):
         self.value = value
 
 
+class_value.__doc__ = _slot_doc(class_value.__doc__)
+
+
 class class_property(class_value):
     """Property that works with the class and any instance."""
-    def __init__(self, fget=None, fset=None, fdel=None, doc=''):
-        super().__init__(None, doc)
-
-        # Remove the value attribute
-        del self.value
+    __slots__ = ('fget', 'fset', 'fdel', '_fget_args', '_fset_args', '_fdel_args',
+                 '_fget_takes_instance', '_fset_takes_value_only', '_fdel_takes_instance')
 
-        # Set attributes
+    def __init__(self, fget=None, fset=None, fdel=None, doc=''):
+        # Set attributes. The value slot is left unset, a class_property does not hold a value
         self.fget = None
         self.fset = None
         self.fdel = None
-        self.__doc__ = doc
+        self._doc = doc
 
         # Find num arguments
         self._fget_args = 0
         self._fset_args = 0
         self._fdel_args = 0
+        self._fget_takes_instance = False
+        self._fset_takes_value_only = True
+        self._fdel_takes_instance = False
 
         # Call setting functions
         if fget is not None:
@@ -257,31 +414,31 @@ class class_property(class_value):
             self.deleter(fdel)
 
     def __get__(self, instance, owner=None):
-        if self.fget is None:
+        fget = self.fget
+        if fget is None:
             raise AttributeError("unreadable attribute")
 
-        if self._fget_args > 0:
-            return self.fget(instance or owner)
-        else:
-            return self.fget()
+        if self._fget_takes_instance:
+            return fget(instance or owner)
+        return fget()
 
     def __set__(self, obj, value):
-        if self.fset is None:
+        fset = self.fset
+        if fset is None:
             raise AttributeError("can't set attribute")
 
-        if self._fset_args > 1:
-            return self.fset(obj, value)
-        else:
-            return self.fset(value)
+        if self._fset_takes_value_only:
+            return fset(value)
+        return fset(obj, value)
 
     def __delete__(self, instance=None):
-        if self.fdel is None:
+        fdel = self.fdel
+        if fdel is None:
             raise AttributeError("can't delete attribute")
 
-        if self._fdel_args > 0:
-            return self.fdel(instance)
-        else:
-            return self.fdel()
+        if self._fdel_takes_instance:
+            return fdel(instance)
+        return fdel()
 
     def getter(self, fget):
         self.fget = fget
@@ -289,10 +446,10 @@ class class_property(class_value):
         if callable(self.fget):
             if not self.__doc__:
                 self.__doc__ = self.fget.__doc__
-            sig = inspect.signature(self.fget)
-            self._fget_args = len(sig.parameters)
+            self._fget_args = _arg_count(self.fget)
         else:
             self._fget_args = 0
+        self._fget_takes_instance = self._fget_args > 0
 
         return self
 
@@ -300,10 +457,10 @@ class class_property(class_value):
         self.fset = fset
 
         if callable(self.fset):
-            sig = inspect.signature(self.fset)
-            self._fset_args = len(sig.parameters)
+            self._fset_args = _arg_count(self.fset)
         else:
             self._fset_args = 0
+        self._fset_takes_value_only = self._fset_args <= 1
 
         return self
 
@@ -311,9 +468,21 @@ class class_property(class_value):
         self.fdel = fdel
 
         if callable(self.fdel):
-            sig = inspect.signature(self.fdel)
-            self._fdel_args = len(sig.parameters)
+            self._fdel_args = _arg_count(self.fdel)
         else:
             self._fdel_args = 0
+        self._fdel_takes_instance = self._fdel_args > 0
 
         return self
+
+
+# Use the compiled descriptors when the optional extension is built. metaclass and decorate look up class_value at
+# call time, so they work with whichever classes are exported here.
+_py_class_value, _py_class_property = class_value, class_property  # Kept to compare with the compiled classes
+
+try:
+    from ._descriptors import class_value, class_property
+except ImportError:
+    pass
+
+_CV_TYPE_SET = frozenset((class_value, class_property))
@@ -9,6 +9,43 @@ import os
 import glob
 import sys
 from setuptools import setup, Extension, find_packages
+from setuptools.command.build_ext import build_ext
+
+try:
+    from setuptools.errors import CCompilerError, ExecError, PlatformError
+except ImportError:  # Older setuptools
+    from distutils.errors import CCompilerError, DistutilsExecError as ExecError, DistutilsPlatformError as PlatformError
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+
+class optional_build_ext(build_ext):
+    """Build the optional C extensions, but install the pure Python package if they cannot be compiled."""
+    def run(self):
+        try:
+            super().run()
+        except PlatformError as err:
+            self.warn_optional(err)
+
+    def build_extensions(self):
+        super().build_extensions()
+
+        # Do not copy or install the extensions that failed
+        self.extensions = [ext for ext in self.extensions if not getattr(ext, 'build_failed', False)]
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except (CCompilerError, ExecError, PlatformError, ValueError) as err:
+            ext.build_failed = True
+            self.warn_optional(err)
+
+    def warn_optional(self, err):
+        print('WARNING: Could not compile the optional extensions, using the pure Python descriptors ({})'.format(err),
+              file=sys.stderr)
 
 
 def read(fname):
@@ -45,6 +82,10 @@ if __name__ == "__main__":
         #           sources=['file.c', 'dir/file.c'],
         #           include_dirs=['./dir'])
         ]
+    if cythonize is not None:
+        # Optional compiled descriptors. The pure Python descriptors are used when this is not built.
+        extensions.extend(cythonize([Extension('class_property._descriptors', ['class_property/_descriptors.pyx'])],
+                                    language_level=3))
 
     setup(name=name,
           version=version,
@@ -66,6 +107,7 @@ if __name__ == "__main__":
           scripts=[file for file in glob.iglob('bin/*.py')],  # Run with python -m Scripts.module args
 
           ext_modules=extensions,  # C extensions
+          cmdclass={'build_ext': optional_build_ext},
           packages=packages,
           include_package_data=True,
           package_data={pkg: ['*', '*/*', '*/*/*', '*/*/*/*', '*/*/*/*/*']
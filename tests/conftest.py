@@ -0,0 +1,34 @@
+import sys
+
+
+def _check_shared(owner, instance, attr, class_set, instance_set):
+    """Set the attribute through the class then the instance and check both see the same value each time."""
+    setattr(owner, attr, class_set)
+    assert getattr(owner, attr) == class_set, getattr(owner, attr)
+    assert getattr(instance, attr) == class_set, getattr(instance, attr)
+
+    setattr(instance, attr, instance_set)
+    assert getattr(owner, attr) == instance_set, getattr(owner, attr)
+    assert getattr(instance, attr) == instance_set, getattr(instance, attr)
+
+
+def _run_all(filename):
+    """Run the tests in the given file with pytest when a test module is run as a script."""
+    import pytest
+    sys.exit(pytest.main(['-q', filename]))
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'perf: descriptor microbenchmark, run with `pytest -m perf`')
+
+
+def pytest_collection_modifyitems(config, items):
+    import pytest
+
+    if 'perf' in (config.getoption('markexpr') or ''):
+        return
+
+    skip_perf = pytest.mark.skip(reason='perf test, run with `pytest -m perf`')
+    for item in items:
+        if 'perf' in item.keywords:
+            item.add_marker(skip_perf)
@@ -1,32 +1,61 @@
+import inspect
+import functools
+
+import pytest
+from conftest import _check_shared
+
+import class_property as class_property_module
+from class_property import metaclass, decorate, class_value, class_property
 
 
 def test_import():
-    from class_property import metaclass, decorate, class_value, class_property
+    assert class_property_module.metaclass is metaclass
+    assert class_property_module.decorate is decorate
+    assert class_property_module.class_value is class_value
+    assert class_property_module.class_property is class_property
 
 
-def test_class_property():
-    from class_property import class_property
+@pytest.mark.parametrize('attr, class_set, instance_set', [('value', 1, 2), ('no_arg', 15, 37)])
+def test_class_property(attr, class_set, instance_set):
+    _storage = {'A': None, 'B': None}
 
     @class_property.decorate
     class MyClass(object):
-        _A = None
-        _B = None
-
         @class_property
         def value(self):
-            return MyClass._A
+            return _storage['A']
 
         @value.setter
         def value(self, value):
-            MyClass._A = value
+            _storage['A'] = value
 
         @class_property
         def no_arg():
-            return MyClass._B
+            return _storage['B']
 
         @no_arg.setter
         def no_arg(value):
-            MyClass._B = value
+            _storage['B'] = value
+
+    # ===== Test normal and no arg property with value =====
+    mc = MyClass()
+    assert getattr(MyClass, attr) is None
+    assert getattr(mc, attr) is None
+
+    _check_shared(MyClass, mc, attr, class_set, instance_set)
+
+
+def test_call():
+    _storage = {'VALUE': None}
+
+    class MyClass(object, metaclass=class_property_module.metaclass()):
+        @class_property_module
+        def value(self):
+            return _storage['VALUE']
+
+        @value.setter
+        def value(self, value):
+            _storage['VALUE'] = value
 
     # ===== Test normal property with value =====
     mc = MyClass()
@@ -41,50 +70,186 @@ def test_class_property():
     assert MyClass.value == 2
     assert mc.value == 2
 
-    # ===== Test no arg property with value =====
-    assert MyClass.no_arg is None
-    assert mc.no_arg is None
 
-    MyClass.no_arg = 15
-    assert MyClass.no_arg == 15
-    assert mc.no_arg == 15
+def test_partial_and_callable_functions():
+    class Storage(object):
+        value = None
 
-    mc.no_arg = 37
-    assert MyClass.no_arg == 37
-    assert mc.no_arg == 37
+        def get(self):
+            return self.value
 
+        def set(self, value):
+            self.value = value
 
-def test_call():
-    import class_property
+    def set_item(storage, key, value):
+        setattr(storage, key, value)
 
-    class MyClass(object, metaclass=class_property.metaclass()):
-        _VALUE = None
+    storage = Storage()
 
-        @class_property
-        def value(self):
-            return MyClass._VALUE
-
-        @value.setter
-        def value(self, value):
-            MyClass._VALUE = value
+    @class_property.decorate
+    class MyClass(object):
+        value = class_property(storage.get, functools.partial(set_item, storage, 'value'))
 
-    # ===== Test normal property with value =====
     mc = MyClass()
     assert MyClass.value is None
-    assert mc.value is None
-
     MyClass.value = 1
-    assert MyClass.value == 1
+    assert storage.value == 1
     assert mc.value == 1
 
     mc.value = 2
+    assert storage.value == 2
     assert MyClass.value == 2
-    assert mc.value == 2
 
+    class Getter(object):
+        def __call__(self, obj):
+            return obj
 
-def test_class_property_inheritance():
-    from class_property import class_property
+    @class_property.decorate
+    class OtherClass(object):
+        this = class_property(Getter())
+
+    oc = OtherClass()
+    assert OtherClass.this is OtherClass
+    assert oc.this is oc
+
+
+def _wraps(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+    return wrapper
+
+
+def test_wrapped_functions():
+    class MyClass(object, metaclass=class_property.metaclass()):
+        @class_property
+        @_wraps
+        def value(cls):
+            return cls
+
+        @class_property
+        @_wraps
+        def no_arg():
+            return 7
+
+    mc = MyClass()
+    assert MyClass.value is MyClass
+    assert mc.value is mc
+    assert MyClass.no_arg == 7
+    assert mc.no_arg == 7
 
+
+class _Methods(object):
+    def method(self, a, b=1):
+        pass
+
+    def varargs(*args):
+        pass
+
+    def __call__(self, x, *, y):
+        pass
+
+
+class _StaticCall(object):
+    @staticmethod
+    def __call__(x):
+        pass
+
+
+def _func(a, *args, b, **kwargs):
+    pass
+
+
+def _two(a, b, c=1):
+    pass
+
+
+def _with_signature(a, b=1):
+    pass
+
+
+_with_signature.__signature__ = inspect.Signature([])
+
+
+@pytest.mark.parametrize('fn', [
+    _func, _two, lambda: None, _wraps(_two), _wraps(lambda: None), _with_signature,
+    _Methods().method, _Methods.method, _Methods().varargs, _Methods(), _StaticCall(), staticmethod(_two),
+    functools.partial(_two, 1), functools.partial(_two, c=2), functools.partial(_func, 1, 2),
+    functools.partial(_wraps(_two), 1), functools.partial(_Methods().method, 1),
+    len, print, [].append, dict.get, _Methods,
+    ])
+def test_arg_count(fn):
+    from class_property.descriptors import _arg_count
+
+    try:
+        expected = len(inspect.signature(fn).parameters)
+    except (TypeError, ValueError):
+        expected = 0
+    assert _arg_count(fn) == expected
+
+
+def test_reassign_functions():
+    prop = class_property(lambda: 1, lambda value: None)
+
+    @class_property.decorate
+    class MyClass(object):
+        value = prop
+
+    assert MyClass.value == 1
+    prop.fget = lambda: 2
+    assert MyClass.value == 2
+
+    prop.fget = None
+    with pytest.raises(AttributeError):
+        MyClass.value
+
+    prop.fset = None
+    with pytest.raises(AttributeError):
+        MyClass.value = 3
+
+
+def test_doc():
+    def value(self):
+        """Value doc"""
+        return 1
+
+    assert class_property(value).__doc__ == 'Value doc'
+    assert class_property(value, doc='Explicit doc').__doc__ == 'Explicit doc'
+    assert class_property(doc='Only doc').__doc__ == 'Only doc'
+    assert class_property.__doc__ == 'Property that works with the class and any instance.'
+
+    prop = class_property(value)
+    prop.__doc__ = 'New doc'
+    assert prop.__doc__ == 'New doc'
+
+
+def test_missing_functions():
+    @class_property.decorate
+    class MyClass(object):
+        value = class_property()
+
+    mc = MyClass()
+    for func in (lambda: MyClass.value, lambda: mc.value):
+        try:
+            func()
+            raise AssertionError('class_property without fget should not be readable')
+        except AttributeError:
+            pass
+
+    try:
+        mc.value = 1
+        raise AssertionError('class_property without fset should not be settable')
+    except AttributeError:
+        pass
+
+    try:
+        del mc.value
+        raise AssertionError('class_property without fdel should not be deletable')
+    except AttributeError:
+        pass
+
+
+def test_class_property_inheritance():
     class MyClass(object, metaclass=class_property.metaclass()):
         _value = None
 
@@ -110,8 +275,6 @@ def test_class_property_inheritance():
 
 
 def test_class_value_inherit_class_property():
-    from class_property import class_value, class_property
-
     class MyClass(object, metaclass=class_value.metaclass()):
         value = class_value(1)
 
@@ -141,8 +304,6 @@ def test_class_value_inherit_class_property():
 
 
 def test_class_value_inherit_class_property_new_metaclass():
-    from class_property import class_value, class_property
-
     class MyClass(object, metaclass=class_value.metaclass()):
         value = class_value(1)
 
@@ -173,12 +334,5 @@ def test_class_value_inherit_class_property_new_metaclass():
 
 
 if __name__ == '__main__':
-    test_import()
-    test_class_property()
-    test_call()
-
-    test_class_property_inheritance()
-    test_class_value_inherit_class_property()
-    test_class_value_inherit_class_property_new_metaclass()
-
-    print('All tests finished successfully!')
+    from conftest import _run_all
+    _run_all(__file__)
@@ -1,41 +1,55 @@
+import pytest
+from conftest import _check_shared
 
+from class_property import class_value, class_property
 
-def test_import():
-    from class_property import class_value, class_property
 
+def test_import():
+    assert issubclass(class_property, class_value)
 
-def test_class_value():
-    from class_property import class_value
 
+@pytest.fixture(scope='module')
+def cv_classes():
+    """Classes shared by the tests in this module. Call _reset before using them."""
     @class_value.decorate
     class MyClass(object):
         value = class_value(1)
 
-    mc = MyClass()
-    assert mc.value == 1
-    assert MyClass.value == 1
+    class SubClass(MyClass):
+        hello = class_value("World")
 
-    MyClass.value = 3
-    assert mc.value == 3
-    assert MyClass.value == 3
+    return MyClass, SubClass
 
-    mc.value = 2
-    assert mc.value == 2
-    assert MyClass.value == 2
 
+def _reset(MyClass, SubClass):
+    """Set the default class values, which other tests may have changed."""
+    MyClass.value = 1
+    SubClass.hello = "World"
 
-    class SubClass(MyClass):
-        hello = class_value("World")
 
-    sub = SubClass()
-    SubClass.hello = 'name'
-    assert sub.hello == 'name'
-    assert SubClass.hello == 'name'
+@pytest.mark.parametrize('owner_name, attr, default, class_set, instance_set', [
+    ('MyClass', 'value', 1, 3, 2),
+    ('SubClass', 'hello', 'World', 'name', 'John Doe'),
+    ])
+def test_class_value(cv_classes, owner_name, attr, default, class_set, instance_set):
+    MyClass, SubClass = cv_classes
+    _reset(MyClass, SubClass)
+
+    owner = {'MyClass': MyClass, 'SubClass': SubClass}[owner_name]
+    inst = owner()
+    assert getattr(inst, attr) == default
+    assert getattr(owner, attr) == default
+
+    _check_shared(owner, inst, attr, class_set, instance_set)
 
-    sub.hello = 'John Doe'
-    assert sub.hello == 'John Doe'
-    assert SubClass.hello == 'John Doe'
 
+def test_class_value_shared_with_subclass(cv_classes):
+    MyClass, SubClass = cv_classes
+    _reset(MyClass, SubClass)
+
+    # The subclass shares the class value with the parent class
+    mc = MyClass()
+    sub = SubClass()
     sub.value = 7
     assert SubClass.value == 7, SubClass.value
     assert sub.value == 7, sub.value
@@ -43,27 +57,175 @@ def test_class_value():
     assert MyClass.value == 7, MyClass.value
 
 
-def test_class_value_inhertance():
-    from class_property import class_value
-
-    class MyClass(object, metaclass=class_value.metaclass()):
+def test_decorate_instance_attributes():
+    @class_value.decorate
+    class MyClass(object):
         value = class_value(1)
 
-    class SubClass(MyClass):
+    @class_value.decorate
+    class SlotClass(object):
+        __slots__ = ('name',)
+        value = class_value(2)
+
+    assert MyClass.__name__ == 'MyClass', MyClass.__name__
+    assert MyClass.__qualname__ == 'test_decorate_instance_attributes.<locals>.MyClass', MyClass.__qualname__
+    assert MyClass.__module__ == __name__, MyClass.__module__
+
+    mc = MyClass()
+    mc.name = 'abc'
+    assert vars(mc) == {'name': 'abc'}, vars(mc)
+
+    sc = SlotClass()
+    sc.name = 'abc'
+    assert sc.name == 'abc', sc.name
+    assert SlotClass.value == 2, SlotClass.value
+
+    @class_value.decorate
+    class PrivateSlotClass(object):
+        __slots__ = ('__x',)
+        value = class_value(3)
+
+        def set_x(self, x):
+            self.__x = x
+
+        def get_x(self):
+            return self.__x
+
+    psc = PrivateSlotClass()
+    psc.set_x(4)
+    assert psc.get_x() == 4, psc.get_x()
+    assert PrivateSlotClass.value == 3, PrivateSlotClass.value
+
+
+def test_class_value_inhertance(cv_classes):
+    MyClass, SubClass = cv_classes
+    _reset(MyClass, SubClass)
+
+    class ValueSubClass(MyClass):
         value = 2
 
+    assert MyClass.value == 2, MyClass.value
+
     mc = MyClass
-    sub = SubClass()
+    sub = ValueSubClass()
     sub.value = 7
-    assert SubClass.value == 7, SubClass.value
+    assert ValueSubClass.value == 7, ValueSubClass.value
     assert sub.value == 7, sub.value
     assert mc.value == 7, mc.value
     assert MyClass.value == 7, MyClass.value
+    assert SubClass.value == 7, SubClass.value
 
 
-if __name__ == '__main__':
-    test_import()
-    test_class_value()
-    test_class_value_inhertance()
+def test_class_value_separate_metaclass():
+    @class_value.decorate
+    class MyClass(object):
+        value = class_value(1)
+
+    @class_value.decorate
+    class OtherClass(object):
+        value = class_value(2)
+
+    # Each decorated class gets its own metaclass, so the class values are not shared
+    assert MyClass.value == 1, MyClass.value
+    assert OtherClass.value == 2, OtherClass.value
+
+    OtherClass.value = 3
+    assert MyClass.value == 1, MyClass.value
+    assert OtherClass.value == 3, OtherClass.value
+
+
+def test_class_value_shared_metaclass():
+    # Reusing one metaclass object shares the class values, which is why each test class creates its own metaclass
+    meta = class_value.metaclass()
+
+    class MyClass(object, metaclass=meta):
+        value = class_value(1)
+
+    class OtherClass(object, metaclass=meta):
+        value = class_value(2)
+
+    assert MyClass.value == 2, MyClass.value
+    assert OtherClass.value == 2, OtherClass.value
+
+    OtherClass.value = 3
+    assert MyClass.value == 3, MyClass.value
+    assert OtherClass.value == 3, OtherClass.value
+
+
+def test_class_value_subclass():
+    class upper_value(class_value):
+        def __set__(self, obj, value):
+            super().__set__(obj, value.upper())
+
+    class MyClass(object, metaclass=class_value.metaclass()):
+        value = upper_value('hello')
+
+    mc = MyClass()
+    MyClass.value = 'abc'
+    assert MyClass.value == 'ABC', MyClass.value
+    assert mc.value == 'ABC', mc.value
+
+    mc.value = 'def'
+    assert MyClass.value == 'DEF', MyClass.value
+    assert mc.value == 'DEF', mc.value
+
+
+def test_class_value_weakref():
+    import weakref
+
+    cv = class_value(1)
+    cp = class_property(lambda: 1)
+    assert weakref.ref(cv)() is cv
+    assert weakref.ref(cp)() is cp
+
+
+def test_compiled_descriptors():
+    _descriptors = pytest.importorskip('class_property._descriptors')
+    from class_property import descriptors
+
+    # The compiled classes replace the pure Python classes everywhere
+    assert descriptors.class_value is _descriptors.class_value is class_value
+    assert descriptors.class_property is _descriptors.class_property is class_property
+
+    # Both backends behave the same
+    for cv_cls, cp_cls in ((descriptors._py_class_value, descriptors._py_class_property),
+                           (_descriptors.class_value, _descriptors.class_property)):
+        cv = cv_cls(1, 'Value doc')
+        assert (cv.value, cv.__doc__) == (1, 'Value doc')
+        del cv.value
+        with pytest.raises(AttributeError):
+            cv.value
 
-    print('All tests finished successfully!')
+        prop = cp_cls(lambda self: 1, doc='Property doc')
+        assert prop.__doc__ == 'Property doc'
+        with pytest.raises(AttributeError):
+            prop.value
+
+        assert (prop._fget_args, prop._fset_args, prop._fdel_args) == (1, 0, 0)
+        assert (prop._fget_takes_instance, prop._fset_takes_value_only, prop._fdel_takes_instance) == \
+            (True, True, False)
+        prop._fget_args = 0
+        prop._fget_takes_instance = False
+        assert (prop._fget_args, prop._fget_takes_instance) == (0, False)
+
+
+def test_class_value_subclass_doc():
+    class my_value(class_value):
+        """My value."""
+        def __init__(self, value):
+            self.value = value
+
+    assert my_value.__doc__ == 'My value.'
+    assert my_value(3).__doc__ == 'My value.'
+    assert class_value(1, 'Instance doc').__doc__ == 'Instance doc'
+
+    class sub_value(class_value):
+        """Sub value."""
+
+    assert sub_value.__doc__ == 'Sub value.'
+    assert sub_value(3, 'x').__doc__ == 'x'
+
+
+if __name__ == '__main__':
+    from conftest import _run_all
+    _run_all(__file__)
@@ -0,0 +1,57 @@
+import time
+
+import pytest
+
+from class_property import class_value, class_property
+
+
+LOOPS = 10000
+BUDGET = 0.5  # Seconds for LOOPS get/set pairs. Far above the expected time, this only catches large regressions.
+
+
+class ValueClass(object, metaclass=class_value.metaclass()):
+    value = class_value(0)
+
+
+# Kept outside of the class, so the timed functions do not go through the metaclass attribute lookup
+_storage = {'VALUE': 0}
+
+
+class PropertyClass(object, metaclass=class_property.metaclass()):
+    @class_property
+    def value(self):
+        return _storage['VALUE']
+
+    @value.setter
+    def value(self, value):
+        _storage['VALUE'] = value
+
+
+def _time_get_set(obj):
+    """Return the time to set and get obj.value LOOPS times."""
+    start = time.perf_counter()
+    for i in range(LOOPS):
+        obj.value = i
+        x = obj.value
+    return time.perf_counter() - start
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize('cls', [ValueClass, PropertyClass])
+def test_class_hot_loop(cls):
+    dt = _time_get_set(cls)
+    assert cls.value == LOOPS - 1
+    assert dt < BUDGET, dt
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize('cls', [ValueClass, PropertyClass])
+def test_instance_hot_loop(cls):
+    dt = _time_get_set(cls())
+    assert cls.value == LOOPS - 1
+    assert dt < BUDGET, dt
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(pytest.main(['-q', '-m', 'perf', __file__]))
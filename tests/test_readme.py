@@ -1,7 +1,7 @@
+from class_property import class_value, class_property, decorate, metaclass
 
-def test_class_value_usage():
-    from class_property import class_value
 
+def test_class_value_usage():
     # doesn't matter if class_value.decorate, class_property.decorate, or decorate (same with metaclass)
     class MyClass(object, metaclass=class_value.metaclass()):
         value = class_value(1)
@@ -39,8 +39,6 @@ def test_class_value_usage():
 
 
 def test_class_property_usage():
-    from class_property import class_value, class_property, decorate, metaclass
-
     global GLOB
     GLOB = 'Hello'
 
@@ -117,9 +115,6 @@ def test_class_property_usage():
 
 
 def test_change_from_value_to_property():
-    from class_property import class_value, class_property
-
-
     class MyClass(object, metaclass=class_value.metaclass()):
         value = class_value(1)
 
@@ -163,9 +158,6 @@ def test_change_from_value_to_property():
 
 
 def test_change_property_disconnect():
-    from class_property import class_property
-
-
     class MyClass(object, metaclass=class_property.metaclass()):
         _VALUE1 = 1
 
@@ -208,10 +200,5 @@ def test_change_property_disconnect():
 
 
 if __name__ == '__main__':
-    test_class_value_usage()
-    test_class_property_usage()
-
-    test_change_from_value_to_property()
-    test_change_property_disconnect()
-
-    print('All tests finished successfully!')
+    from conftest import _run_all
+    _run_all(__file__)